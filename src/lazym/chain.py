@@ -20,20 +20,21 @@ def format_commit_message(message, fmt):
     return message  # Keep original format if not specified
 
 
-def get_llm():
+def get_llm(model=None):
+    model = model or configurations['model']
     temperature = float(configurations.get('temperature', DEFAULT_TEMPERATURE))
-    if configurations['model'].startswith('groq:'):
+    if model.startswith('groq:'):
         return ChatGroq(
-            model=configurations['model'][5:],
+            model=model[5:],
             max_retries=2,
             temperature=temperature,
         )
-    return OllamaLLM(model=configurations['model'], temperature=temperature)
+    return OllamaLLM(model=model, temperature=temperature)
 
 
-def get_chain(prompt):
+def get_chain(prompt, model=None):
     prompt = PromptTemplate(template=prompt)
-    llm = get_llm()
+    llm = get_llm(model)
     return prompt | llm
 
 
@@ -1,10 +1,12 @@
 import os
 import shutil
 import sys
-from typing import Optional
+from pathlib import Path
+from typing import List, Optional
 
 import typer
 from beaupy import confirm, select
+from halo import Halo
 from prettytable import PrettyTable
 from prompt_toolkit import PromptSession
 from prompt_toolkit.key_binding import KeyBindings
@@ -18,8 +20,14 @@ from lazym.git import (
     get_repo_info,
     get_repo_root,
     push_tag_to_origin,
+    ref_exists,
+)
+from lazym.github import (
+    create_github_release,
+    get_latest_tags,
+    publish_github_releases,
+    upload_release_assets,
 )
-from lazym.github import create_github_release, get_latest_tags
 from lazym.version import bump_version
 
 
@@ -191,17 +199,39 @@ def tag(
         print("Tag not pushed to remote.")
 
 
+def _print_upload_progress(path, sent, total):
+    if sent == total:
+        print(f"Sent {os.path.basename(path)} ({total} bytes), waiting for GitHub...")
+
+
 @app.command()
-def release():
+def release(
+    notes: Annotated[Optional[bool], typer.Option('--notes')] = None,
+    repos: Annotated[Optional[List[str]], typer.Option('--repos')] = None,
+    asset: Annotated[Optional[List[Path]], typer.Option('--asset', exists=True, dir_okay=False)] = None,
+    workers: int = 4,
+):
     '''
     Create a new release on GitHub based on the selected tag.
     This command allows you to publish a new version of your project.
+    Use --repos owner/name (repeatable) to release several repositories
+    at once and --asset (repeatable) to upload build artifacts.
     '''
     if configurations.get('service', '').lower() == 'github':
-        repo_owner, repo_name = get_repo_info()
-        if not (repo_owner and repo_name):
-            print("Error: Could not determine repository information.")
-            sys.exit(1)
+        token = configurations.get('token', '')
+        if repos:
+            if notes is True:
+                print("Error: --notes cannot be combined with --repos.")
+                sys.exit(1)
+            if any('/' not in r for r in repos):
+                print("Error: --repos expects repositories as owner/name.")
+                sys.exit(1)
+            repo_owner, repo_name = repos[0].split('/', 1)
+        else:
+            repo_owner, repo_name = get_repo_info()
+            if not (repo_owner and repo_name):
+                print("Error: Could not determine repository information.")
+                sys.exit(1)
         latest_tags = get_latest_tags(repo_owner, repo_name, limit=5)
         if not latest_tags:
             print("Failed to fetch latest tags.")
@@ -209,17 +239,129 @@ def release():
         print("Select a tag to release on GitHub:")
         selected_tag = select(latest_tags)
         print(f"Selected tag for release: {selected_tag}")
-        create_github_release(
-            repo_owner,
-            repo_name,
-            selected_tag,
-            selected_tag,
-            token=configurations.get('token', ''),
-        )
+
+        asset_paths = [str(p) for p in asset or []]
+        if repos:
+            if asset_paths:
+                print(f"Uploading {len(asset_paths)} asset(s) to each repository...")
+            published = publish_github_releases(
+                repos,
+                selected_tag,
+                selected_tag,
+                assets=asset_paths,
+                max_workers=workers,
+                progress=_print_upload_progress,
+                token=token,
+            )
+        else:
+            body = None
+            if notes is True:
+                from .release_notes import generate_release_notes
+
+                repo_root = get_repo_root()
+                if not ref_exists(repo_root, selected_tag):
+                    print(f"Error: Tag {selected_tag} not found locally. Run `git fetch --tags` first.")
+                    sys.exit(1)
+                with Halo(text='Generating release notes', spinner='spinner') as spinner:
+                    body = generate_release_notes(repo_root, selected_tag)
+                    spinner.succeed('Generated release notes')
+                if not body:
+                    print(f"No commits found for {selected_tag}; falling back to GitHub release notes.")
+            r = create_github_release(
+                repo_owner,
+                repo_name,
+                selected_tag,
+                selected_tag,
+                body=body,
+                token=token,
+                generate_release_notes=not body,
+            )
+            uploaded = {}
+            if r is not None and asset_paths:
+                print(f"Uploading {len(asset_paths)} asset(s)...")
+                uploaded = upload_release_assets(
+                    r,
+                    asset_paths,
+                    token=token,
+                    max_workers=workers,
+                    progress=_print_upload_progress,
+                )
+            published = {f'{repo_owner}/{repo_name}': (r, uploaded)}
+
+        failed = []
+        for name, (r, uploaded) in published.items():
+            if r is None:
+                failed.append(name)
+                continue
+            for path, a in uploaded.items():
+                if a is None:
+                    print(f"Failed to upload {os.path.basename(path)} to {name}")
+                else:
+                    print(f"Uploaded {os.path.basename(path)} to {name}")
+            if any(a is None for a in uploaded.values()):
+                failed.append(name)
+        if failed:
+            print(f"Release failed for: {', '.join(failed)}")
+            sys.exit(1)
         return
     raise NotImplementedError
 
 
+def _fmt_metric(value, digits=2):
+    return '-' if value is None else f'{value:.{digits}f}'
+
+
+@app.command(name='eval')
+def evaluate(
+    model: Annotated[Optional[List[str]], typer.Option('--model')] = None,
+    prompt: Annotated[Optional[List[Path]], typer.Option('--prompt', exists=True, dir_okay=False)] = None,
+    limit: int = 20,
+    concurrency: int = 2,
+    max_diff_chars: int = 20000,
+    output_json: Optional[Path] = None,
+    output_csv: Optional[Path] = None,
+):
+    '''
+    Evaluate models and prompts against the human-written messages in the
+    local git history.
+    '''
+    from .evaluate import build_dataset, run_evaluation, summarize, write_csv, write_json
+    from .prompt import PROMPT
+
+    samples = build_dataset(get_repo_root(), limit=limit, max_diff_chars=max_diff_chars)
+    if not samples:
+        print("No commits with diffs found to evaluate.")
+        sys.exit(1)
+
+    models = model or [configurations['model']]
+    prompts = {str(p): p.read_text() for p in prompt} if prompt else {'default': PROMPT}
+    print(f"Evaluating {len(models)} model(s) x {len(prompts)} prompt(s) on {len(samples)} commits...")
+    results = run_evaluation(samples, models, prompts, concurrency=concurrency)
+    summary = summarize(results)
+
+    tb = PrettyTable()
+    tb.field_names = [
+        'Model', 'Prompt', 'Samples', 'Errors', 'p50 (s)', 'p95 (s)',
+        'TTFT p50 (s)', 'TTFT p95 (s)', 'Tokens/s', 'Prompt chars', 'Similarity',
+    ]
+    for s in summary:
+        tb.add_row([
+            s['model'], s['prompt'], s['samples'], s['errors'],
+            _fmt_metric(s['latency_p50']), _fmt_metric(s['latency_p95']),
+            _fmt_metric(s['ttft_p50']), _fmt_metric(s['ttft_p95']),
+            _fmt_metric(s['tokens_per_sec'], 1), _fmt_metric(s['prompt_chars_mean'], 0),
+            _fmt_metric(s['similarity_mean'], 3),
+        ])
+    print(tb)
+
+    if output_json:
+        write_json(output_json, summary, results)
+        print(f"Results written to {output_json}")
+    if output_csv:
+        write_csv(output_csv, results)
+        print(f"Results written to {output_csv}")
+
+
 @app.command()
 def ci(hint: str):
     '''
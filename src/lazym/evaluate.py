@@ -0,0 +1,180 @@
+import csv
+import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from langchain.prompts import PromptTemplate
+
+from .chain import format_commit_message, get_chain
+from .configs import configurations
+from .git import get_commits
+
+
+class Sample(NamedTuple):
+    sha: str
+    diff: str
+    message: str
+
+
+class Result(NamedTuple):
+    model: str
+    prompt: str
+    sha: str
+    prompt_chars: Optional[int]
+    latency: Optional[float]
+    ttft: Optional[float]
+    output_tokens: int
+    tokens_per_sec: Optional[float]
+    similarity: Optional[float]
+    generated: str
+    expected: str
+    error: str = ''
+
+
+def build_dataset(repo_root, limit=50, max_diff_chars=20000):
+    '''
+    Build (diff, human message) pairs from the local commit history.
+    Commits without a diff or with an oversized diff are skipped.
+    '''
+    samples = []
+    for c in get_commits(repo_root, limit=limit):
+        if not c.diff or len(c.diff) > max_diff_chars:
+            continue
+        samples.append(Sample(c.sha, c.diff, c.subject))
+    return samples
+
+
+def similarity(a, b):
+    return SequenceMatcher(None, a.lower().strip(), b.lower().strip()).ratio()
+
+
+def percentile(values, p):
+    # nearest-rank percentile; good enough for the small datasets we use
+    values = sorted(v for v in values if v is not None)
+    if not values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(values)))
+    return values[rank - 1]
+
+
+def _chunk_text(chunk):
+    return chunk.content if hasattr(chunk, 'content') else str(chunk)
+
+
+def _errored(model, prompt_name, sample, error, prompt_chars=None):
+    return Result(model, prompt_name, sample.sha, prompt_chars, None, None,
+                  0, None, None, '', sample.message, error)
+
+
+def run_sample(chain, model, prompt_name, prompt_overhead, sample):
+    prompt_chars = prompt_overhead + len(sample.diff)
+    ttft = None
+    chunks = []
+    started = time.perf_counter()
+    try:
+        # every streamed chunk is counted as one output token
+        for chunk in chain.stream({'diff': sample.diff}):
+            if ttft is None:
+                ttft = time.perf_counter() - started
+            chunks.append(_chunk_text(chunk))
+    except Exception as e:
+        return _errored(model, prompt_name, sample, str(e), prompt_chars)
+    latency = time.perf_counter() - started
+    generated = ''.join(chunks).strip()
+    if generated:
+        generated = format_commit_message(generated, configurations['message_format'])
+    gen_time = latency - (ttft or 0)
+    # the first chunk arrives at ttft, so it is not part of the rate
+    tokens_per_sec = None
+    if len(chunks) > 1 and gen_time > 0:
+        tokens_per_sec = (len(chunks) - 1) / gen_time
+    return Result(
+        model, prompt_name, sample.sha, prompt_chars, latency, ttft, len(chunks),
+        tokens_per_sec, similarity(generated, sample.message), generated, sample.message,
+    )
+
+
+def _warm_up(chain, sample):
+    # load the model before timing anything; failures show up in the samples
+    try:
+        chain.invoke({'diff': sample.diff})
+    except Exception:
+        pass
+
+
+def run_evaluation(samples, models, prompts, concurrency=2):
+    '''
+    Run every (model, prompt) combination over the samples, one combination
+    at a time so a local model server never swaps models mid-measurement,
+    with at most `concurrency` requests in flight. Each combination gets an
+    untimed warm-up request. `prompts` maps a name to a template.
+    '''
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        for model in models:
+            for name, prompt in prompts.items():
+                try:
+                    chain = get_chain(prompt, model)
+                    overhead = len(PromptTemplate(template=prompt).format(diff=''))
+                except Exception as e:
+                    # a broken template fails every sample of this combination
+                    results.extend(_errored(model, name, sample, str(e)) for sample in samples)
+                    continue
+                if samples:
+                    _warm_up(chain, samples[0])
+                results.extend(executor.map(
+                    lambda sample: run_sample(chain, model, name, overhead, sample),
+                    samples,
+                ))
+    return results
+
+
+def _mean(values):
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+
+def summarize(results):
+    groups = {}
+    for r in results:
+        groups.setdefault((r.model, r.prompt), []).append(r)
+
+    summary = []
+    for (model, prompt), rs in groups.items():
+        ok = [r for r in rs if not r.error]
+        latencies = [r.latency for r in ok]
+        ttfts = [r.ttft for r in ok]
+        summary.append({
+            'model': model,
+            'prompt': prompt,
+            'samples': len(rs),
+            'errors': len(rs) - len(ok),
+            'latency_p50': percentile(latencies, 50),
+            'latency_p95': percentile(latencies, 95),
+            'ttft_p50': percentile(ttfts, 50),
+            'ttft_p95': percentile(ttfts, 95),
+            'tokens_per_sec': _mean([r.tokens_per_sec for r in ok]),
+            'prompt_chars_mean': _mean([r.prompt_chars for r in rs]),
+            'similarity_mean': _mean([r.similarity for r in ok]),
+        })
+    return summary
+
+
+def write_json(path, summary, results):
+    data = {
+        'summary': summary,
+        'results': [r._asdict() for r in results],
+    }
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False))
+
+
+def write_csv(path, results):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=Result._fields)
+        writer.writeheader()
+        for r in results:
+            writer.writerow(r._asdict())
@@ -4,6 +4,7 @@ import re
 import subprocess
 import sys
 from pathlib import Path
+from typing import NamedTuple
 
 import pyperclip
 
@@ -34,6 +35,73 @@ def get_diff(repo_root):
         os.chdir(current_dir)
 
 
+# separates the records of a single `git log` call; unlikely to appear in
+# commit messages or diffs
+_RECORD_SEP = '\x1e'
+_FIELD_SEP = '\x1f'
+
+
+class Commit(NamedTuple):
+    sha: str
+    message: str
+    diff: str
+
+    @property
+    def subject(self):
+        return self.message.split('\n', 1)[0]
+
+
+def parse_log(output):
+    commits = []
+    for record in output.split(_RECORD_SEP):
+        if not record.strip():
+            continue
+        sha, message, diff = (record.split(_FIELD_SEP, 2) + ['', ''])[:3]
+        commits.append(Commit(sha.strip(), message.strip(), clean_diff(diff.strip('\n'))))
+    return commits
+
+
+def get_commits(repo_root, rev_range=None, limit=None, with_diff=True):
+    '''
+    Collect commits with their messages (and diffs) in one `git log` call.
+    '''
+    cmd = [
+        'git', '-C', repo_root, 'log', '--no-merges', '--no-color',
+        f'--format={_RECORD_SEP}%H{_FIELD_SEP}%B{_FIELD_SEP}',
+    ]
+    if with_diff:
+        cmd.extend(['-p', '--minimal'])
+    if limit:
+        cmd.append(f'-n{limit}')
+    if rev_range:
+        cmd.append(rev_range)
+    result = subprocess.run(cmd, capture_output=True, text=True, errors='replace')
+    if result.returncode != 0:
+        logger.error(f'Error: Unable to read git log. {result.stderr.strip()}')
+        return []
+    return parse_log(result.stdout)
+
+
+def get_commit_diffs(repo_root, shas):
+    '''
+    Fetch the diffs of the given commits in one `git log --stdin` call.
+    Returns a dict mapping each sha to its diff.
+    '''
+    if not shas:
+        return {}
+    cmd = [
+        'git', '-C', repo_root, 'log', '--no-walk=unsorted', '--stdin', '--no-color', '-p',
+        f'--format={_RECORD_SEP}%H{_FIELD_SEP}%B{_FIELD_SEP}',
+    ]
+    result = subprocess.run(
+        cmd, input='\n'.join(shas), capture_output=True, text=True, errors='replace'
+    )
+    if result.returncode != 0:
+        logger.error(f'Error: Unable to read git log. {result.stderr.strip()}')
+        return {}
+    return {c.sha: c.diff for c in parse_log(result.stdout)}
+
+
 def has_commit_history(repo_root):
     return Path(f'{repo_root}/.git/logs/HEAD').exists()
 
@@ -103,3 +171,23 @@ def push_tag_to_origin(tag):
     except Exception as e:
         print(f"Failed to push tag {tag} to remote: {e}")
         sys.exit(1)
+
+
+def get_previous_tag(repo_root, tag):
+    result = subprocess.run(
+        ['git', '-C', repo_root, 'describe', '--tags', '--abbrev=0', f'{tag}^'],
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def ref_exists(repo_root, ref):
+    result = subprocess.run(
+        ['git', '-C', repo_root, 'rev-parse', '--verify', '--quiet', f'{ref}^{{commit}}'],
+        capture_output=True,
+        text=True,
+    )
+    return result.returncode == 0
@@ -1,9 +1,25 @@
 import logging
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logging.basicConfig(level=logging.INFO)
 
+GITHUB_API_URL = 'https://api.github.com'
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def create_session(pool_size=4):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 
 def create_github_release(
     owner,
@@ -14,12 +30,14 @@ def create_github_release(
     token=None,
     draft=False,
     prerelease=False,
-    generate_release_notes=True
+    generate_release_notes=True,
+    api_url=GITHUB_API_URL,
+    session=None,
 ):
     if not token:
         raise ValueError('GitHub API token is required to create a release.')
 
-    url = f'https://api.github.com/repos/{owner}/{repo}/releases'
+    url = f'{api_url}/repos/{owner}/{repo}/releases'
     headers = {
         'Authorization': f'Bearer {token}',
         'Accept': 'application/vnd.github.v3+json'
@@ -34,7 +52,7 @@ def create_github_release(
     if body:
         payload['body'] = body
     
-    response = requests.post(url, headers=headers, json=payload)
+    response = (session or requests).post(url, headers=headers, json=payload)
     if response.status_code == 201:
         logging.info('Release created successfully!')
         return response.json()
@@ -44,6 +62,174 @@ def create_github_release(
         return None
 
 
+def tag_exists(owner, repo, tag_name, token=None, api_url=GITHUB_API_URL, session=None):
+    '''
+    Return whether `tag_name` exists in the repository. Statuses other than
+    200 and 404 (bad token, rate limit, server errors) raise HTTPError.
+    '''
+    url = f'{api_url}/repos/{owner}/{repo}/git/ref/tags/{tag_name}'
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Accept': 'application/vnd.github.v3+json',
+    }
+    response = (session or requests).get(url, headers=headers)
+    if response.status_code == 404:
+        return False
+    response.raise_for_status()
+    return True
+
+
+def publish_github_releases(
+    repos,
+    tag_name,
+    release_name,
+    assets=None,
+    max_workers=4,
+    progress=None,
+    **kwargs,
+):
+    '''
+    Create the same release for several `owner/repo` repositories and
+    upload `assets` to each of them, all concurrently over one pooled
+    session. Repositories without `tag_name` are skipped, since GitHub
+    would otherwise create the tag from the default branch. Returns a dict
+    mapping each repository to (release, {path: asset}); the release or an
+    asset is None if it failed.
+    '''
+    assets = list(assets or [])
+    token = kwargs.get('token')
+    with create_session(max_workers * 2) as session, \
+            ThreadPoolExecutor(max_workers=max(1, max_workers)) as upload_executor:
+        def _create(full_name):
+            owner, repo = full_name.split('/', 1)
+            try:
+                if not tag_exists(
+                    owner,
+                    repo,
+                    tag_name,
+                    token=token,
+                    api_url=kwargs.get('api_url', GITHUB_API_URL),
+                    session=session,
+                ):
+                    logging.error(f'Tag {tag_name} does not exist in {full_name}, skipping.')
+                    return None
+                return create_github_release(
+                    owner, repo, tag_name, release_name, session=session, **kwargs
+                )
+            except requests.RequestException as e:
+                logging.error(f'Failed to create release for {full_name}: {e}')
+                return None
+
+        def _publish(full_name):
+            release = _create(full_name)
+            if release is None or not assets:
+                return release, {}
+            uploads = upload_executor.map(
+                lambda path: _upload(release, path, token, session, progress),
+                assets,
+            )
+            return release, dict(zip(assets, uploads))
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return dict(zip(repos, executor.map(_publish, repos)))
+
+
+class _FileStream:
+    '''
+    File-like wrapper that lets requests stream a file from disk in chunks
+    with a known length, reporting progress as chunks are read.
+    '''
+
+    def __init__(self, path, progress=None, chunk_size=UPLOAD_CHUNK_SIZE):
+        self.path = path
+        self.size = os.path.getsize(path)
+        self.sent = 0
+        self.progress = progress
+        self.chunk_size = chunk_size
+        self._file = open(path, 'rb')
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def read(self, size=-1):
+        if size is None or size < 0:
+            size = self.chunk_size
+        chunk = self._file.read(min(size, self.chunk_size))
+        if chunk:
+            self.sent += len(chunk)
+            if self.progress:
+                self.progress(self.path, self.sent, self.size)
+        return chunk
+
+    def close(self):
+        self._file.close()
+
+
+def upload_release_asset(release, path, token=None, session=None, progress=None, label=None):
+    '''
+    Upload a file as an asset of `release` (as returned by
+    create_github_release) without reading it into memory.
+    `progress` is called with (path, bytes_sent, total_bytes).
+    '''
+    if not token:
+        raise ValueError('GitHub API token is required to upload a release asset.')
+
+    # upload_url is a URI template such as .../assets{?name,label}
+    url = release['upload_url'].split('{', 1)[0]
+    params = {'name': os.path.basename(path)}
+    if label:
+        params['label'] = label
+    headers = {
+        'Authorization': f'Bearer {token}',
+        'Accept': 'application/vnd.github.v3+json',
+        'Content-Type': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+    }
+
+    stream = _FileStream(path, progress)
+    try:
+        response = (session or requests).post(url, headers=headers, params=params, data=stream)
+    finally:
+        stream.close()
+    if response.status_code == 201:
+        logging.info(f'Asset {params["name"]} uploaded successfully!')
+        return response.json()
+
+    logging.error(f'Failed to upload asset {params["name"]}: {response.status_code}')
+    logging.error(response.text)
+    return None
+
+
+def _upload(release, path, token, session, progress):
+    try:
+        return upload_release_asset(
+            release, path, token=token, session=session, progress=progress
+        )
+    except requests.RequestException as e:
+        logging.error(f'Failed to upload asset {os.path.basename(path)}: {e}')
+        return None
+
+
+def upload_release_assets(release, paths, token=None, max_workers=4, progress=None):
+    '''
+    Upload several assets in parallel over a pooled session.
+    Returns a dict mapping each path to its asset, or None if it failed.
+    '''
+    with create_session(max_workers) as session:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            assets = executor.map(
+                lambda path: _upload(release, path, token, session, progress),
+                paths,
+            )
+            return dict(zip(paths, assets))
+
+
 def get_latest_release(owner, repo, token=None):
     url = f'https://api.github.com/repos/{owner}/{repo}/releases/latest'
     headers = {
@@ -30,6 +30,24 @@ Provide the commit message directly with no additional text, quotes, or explanat
 COMMIT_MSG:
 '''
 
+COMMIT_SUMMARY_PROMPT = '''
+Summarize the following git commit in one short sentence for a release note. Describe the user-visible effect of the change, not the implementation. Reply with the sentence only.
+
+<message>
+{message}
+</message>
+
+<diff>
+{diff}
+</diff>
+'''
+
+RELEASE_NOTES_PROMPT = '''
+The following lines summarize the "{group}" changes of a software release, one change per line. Merge duplicates and write them as a concise markdown bullet list, most important change first. Reply with the bullet list only.
+
+{summaries}
+'''
+
 
 def get_prompt():
     prompt_path = Path.home() / '.config' / 'lazym' / 'prompt.txt'
@@ -0,0 +1,178 @@
+import json
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from langchain.prompts import PromptTemplate
+
+from .chain import get_llm
+from .configs import configurations
+from .git import get_commit_diffs, get_commits, get_previous_tag
+from .prompt import COMMIT_SUMMARY_PROMPT, RELEASE_NOTES_PROMPT
+
+CACHE_PATH = Path.home() / '.cache' / 'lazym' / 'summaries.json'
+
+_GROUPS = ['Features', 'Bug Fixes', 'Performance', 'Documentation', 'Maintenance', 'Other Changes']
+
+_CONVENTIONAL_RE = re.compile(r'^(?P<type>\w+)(?:\([^)]*\))?!?:')
+
+_CONVENTIONAL_TYPES = {
+    'feat': 'Features',
+    'fix': 'Bug Fixes',
+    'perf': 'Performance',
+    'docs': 'Documentation',
+    'refactor': 'Maintenance',
+    'chore': 'Maintenance',
+    'build': 'Maintenance',
+    'ci': 'Maintenance',
+    'test': 'Maintenance',
+    'style': 'Maintenance',
+}
+
+# leading verbs of non-conventional subjects, matched as whole words
+_LEADING_WORDS = [
+    (re.compile(r'add(s|ed|ing)?'), 'Features'),
+    (re.compile(r'support(s|ed|ing)?'), 'Features'),
+    (re.compile(r'introduc(e|es|ed|ing)'), 'Features'),
+    (re.compile(r'implement(s|ed|ing)?'), 'Features'),
+    (re.compile(r'fix(es|ed|ing)?'), 'Bug Fixes'),
+    (re.compile(r'correct(s|ed|ing)?'), 'Bug Fixes'),
+    (re.compile(r'resolv(e|es|ed|ing)'), 'Bug Fixes'),
+    (re.compile(r'speed(s|ing)?'), 'Performance'),
+    (re.compile(r'optimi[sz](e|es|ed|ing)'), 'Performance'),
+    (re.compile(r'document(s|ed|ing)?'), 'Documentation'),
+]
+
+
+class SummaryCache:
+    '''
+    Per-commit summaries keyed by model and sha. Commits are immutable, so
+    consecutive releases only summarize the commits they add.
+    '''
+
+    def __init__(self, path=CACHE_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        try:
+            self._data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self._data = {}
+
+    def get(self, model, sha):
+        return self._data.get(f'{model}:{sha}')
+
+    def set(self, model, sha, summary):
+        with self._lock:
+            self._data[f'{model}:{sha}'] = summary
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self.path.write_text(json.dumps(self._data, indent=2, ensure_ascii=False))
+
+
+def group_of(commit):
+    subject = commit.subject.strip()
+    match = _CONVENTIONAL_RE.match(subject)
+    if match and match.group('type').lower() in _CONVENTIONAL_TYPES:
+        return _CONVENTIONAL_TYPES[match.group('type').lower()]
+    words = subject.split()
+    first_word = words[0].lower().rstrip(':,.') if words else ''
+    for pattern, group in _LEADING_WORDS:
+        if pattern.fullmatch(first_word):
+            return group
+    return 'Other Changes'
+
+
+def group_commits(commits):
+    groups = {}
+    for c in commits:
+        groups.setdefault(group_of(c), []).append(c)
+    return {g: groups[g] for g in _GROUPS if g in groups}
+
+
+def _invoke(llm, template, **kwargs):
+    msg = (PromptTemplate(template=template) | llm).invoke(kwargs)
+    if hasattr(msg, 'content'):
+        msg = msg.content
+    return msg.strip()
+
+
+def summarize_commit(llm, commit, max_diff_chars=4000):
+    return _invoke(
+        llm,
+        COMMIT_SUMMARY_PROMPT,
+        message=commit.message,
+        diff=commit.diff[:max_diff_chars],
+    )
+
+
+def summarize_group(llm, group, summaries):
+    return _invoke(
+        llm,
+        RELEASE_NOTES_PROMPT,
+        group=group,
+        summaries='\n'.join(summaries),
+    )
+
+
+def generate_release_notes(
+    repo_root,
+    tag,
+    previous_tag=None,
+    llm=None,
+    model=None,
+    cache=None,
+    concurrency=4,
+):
+    '''
+    Generate markdown release notes for the commits between `previous_tag`
+    (defaults to the tag before `tag`) and `tag`. Returns None when the
+    range has no commits. An injected `llm` needs an explicit `model` and
+    `cache`, so its summaries never land under the configured model.
+    '''
+    if llm is None:
+        model = model or configurations['model']
+        llm = get_llm(model)
+        cache = cache if cache is not None else SummaryCache()
+    elif model is None or cache is None:
+        raise ValueError('model and cache are required when passing an llm.')
+    previous_tag = previous_tag or get_previous_tag(repo_root, tag)
+    rev_range = f'{previous_tag}..{tag}' if previous_tag else tag
+
+    commits = get_commits(repo_root, rev_range=rev_range, with_diff=False)
+    if not commits:
+        return None
+
+    # only the commits not summarized by a previous release need their diffs
+    diffs = get_commit_diffs(
+        repo_root, [c.sha for c in commits if cache.get(model, c.sha) is None]
+    )
+
+    def commit_summary(c):
+        summary = cache.get(model, c.sha)
+        if summary is None:
+            summary = summarize_commit(llm, c._replace(diff=diffs.get(c.sha, '')))
+            cache.set(model, c.sha, summary)
+        return summary
+
+    groups = group_commits(commits)
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        # keep the summaries computed so far even if one LLM call fails
+        try:
+            summaries = dict(zip(
+                [c.sha for c in commits],
+                executor.map(commit_summary, commits),
+            ))
+        finally:
+            cache.save()
+        sections = list(executor.map(
+            lambda item: summarize_group(llm, item[0], [summaries[c.sha] for c in item[1]]),
+            groups.items(),
+        ))
+
+    return '\n\n'.join(
+        f'## {group}\n\n{section}'
+        for group, section in zip(groups, sections)
+    )